@@ -4,160 +4,373 @@ Build script for RegSeek
 Converts YAML artifacts to JSON for the web interface
 """
 
+import argparse
+import hashlib
+import io
 import json
-import yaml
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed artifacts are cached between builds; the cache is also signed with a
+# hash of this script, so editing parse_artifact discards stale entries
+BUILD_CACHE_FILE = os.path.join(".regseek_cache", "build.json")
+BUILD_CACHE_VERSION = 2
+
+# Parsing only uses a process pool from this many stale files up
+MIN_PARALLEL_FILES = 8
+
+# Fields every artifact needs to be included in the site
+REQUIRED_FIELDS = ('title', 'category', 'description')
+
+# Shared read-only default for missing artifact sections
+_EMPTY = MappingProxyType({})
+
+@lru_cache(maxsize=None)
+def get_yaml_load():
+    """Import PyYAML on first use and return yaml.load bound to the fastest safe loader"""
+    import yaml
+    
+    # CSafeLoader is only present when PyYAML was built against libyaml
+    return partial(yaml.load, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def find_artifact_files(artifacts_dir):
+    """Collect (category, path) pairs for every artifact YAML file, skipping templates and hidden files
+    
+    Also returns each category's discovery log lines, keyed by category in scan order.
+    """
+    artifact_files = []
+    category_logs = {}
+    
+    with os.scandir(artifacts_dir) as categories_it:
+        category_entries = [entry for entry in categories_it
+                            if entry.is_dir() and not entry.name.startswith(('_', '.'))]
+    
+    for category_entry in category_entries:
+        log = category_logs[category_entry.name] = [f" Processing category: {category_entry.name}"]
+        
+        with os.scandir(category_entry.path) as files_it:
+            for entry in files_it:
+                if not entry.name.endswith('.yml') or entry.name.startswith('.'):
+                    continue
+                if entry.name.startswith('_'):
+                    log.append(f"    Skipping template: {entry.name}")
+                    continue
+                artifact_files.append((category_entry.name, entry.path))
+    
+    return artifact_files, category_logs
+
+def parse_artifact(artifact_file):
+    """Parse and enrich a single artifact file, returning (artifact or None, log message)"""
+    category, path = artifact_file
+    
+    try:
+        with open(path, 'rb') as f:
+            artifact = get_yaml_load()(f)
+        
+        # Ensure required fields exist
+        if not artifact:
+            return None, f"     Warning: Empty artifact file {path}"
+        
+        # Add metadata
+        artifact['id'] = os.path.basename(path)[:-4]
+        artifact['source_file'] = path
+        
+        # Use category from directory name if not specified
+        if 'category' not in artifact:
+            artifact['category'] = category
+        
+        # Ensure paths is a list
+        if 'paths' in artifact and type(artifact['paths']) is str:
+            artifact['paths'] = [artifact['paths']]
+        
+        # Process enhanced metadata
+        metadata = artifact.get('metadata') or _EMPTY
+        
+        # Add search-friendly tags
+        criticality_tag = (f"criticality-{metadata['criticality']}",) if 'criticality' in metadata else ()
+        search_tags = chain(
+            metadata.get('tags', ()),
+            metadata.get('investigation_types', ()),
+            (artifact['category'],),
+            criticality_tag
+        )
+        
+        artifact['search_tags'] = list(dict.fromkeys(search_tags))  # Remove duplicates, keep order
+        
+        title = artifact.get('title', 'Untitled')
+        criticality = metadata.get('criticality', 'unknown')
+        return artifact, f"    Loaded: {title} ({criticality} criticality)"
+        
+    except Exception as e:
+        return None, f"    Error loading {path}: {e}"
+
+def _cache_signature():
+    """Identify the build script version so cached artifacts are dropped when parsing changes"""
+    with open(__file__, 'rb') as f:
+        return f"{BUILD_CACHE_VERSION}:{hashlib.blake2b(f.read(), digest_size=16).hexdigest()}"
+
+def load_build_cache():
+    """Load the parsed-artifact cache from previous builds, keyed by source file"""
+    try:
+        with open(BUILD_CACHE_FILE, 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get('signature') != _cache_signature():
+        return {}
+    
+    return cache.get('files', {})
+
+def save_build_cache(files):
+    """Persist the parsed-artifact cache for the next build"""
+    try:
+        data = dump_json({'signature': _cache_signature(), 'files': files})
+    except TypeError:
+        # Without orjson, values like unquoted YAML dates can't be encoded; skip caching
+        return
+    
+    # Swap the new cache in whole so an interrupted build never leaves it truncated
+    os.makedirs(os.path.dirname(BUILD_CACHE_FILE), exist_ok=True)
+    tmp_file = BUILD_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, BUILD_CACHE_FILE)
+
+def record_parsed(cache, artifact_files, parsed):
+    """Store parse_artifact results in the cache entries of the files they came from"""
+    for (_, path), (artifact, message) in zip(artifact_files, parsed):
+        cache[path]['data'] = artifact
+        cache[path]['message'] = message
 
 def load_artifacts():
-    """Load all YAML artifacts from the artifacts directory"""
-    artifacts = []
-    artifacts_dir = Path("artifacts")
+    """Load all YAML artifacts from the artifacts directory, yielding them one at a time"""
+    artifacts_dir = "artifacts"
     
     print(f" Scanning {artifacts_dir} for artifacts...")
     
-    if not artifacts_dir.exists():
+    if not os.path.isdir(artifacts_dir):
         print(f" Error: {artifacts_dir} directory not found!")
-        return artifacts
-    
-    for category_dir in artifacts_dir.iterdir():
-        if category_dir.is_dir() and not category_dir.name.startswith('_'):
-            print(f" Processing category: {category_dir.name}")
-            
-            for artifact_file in category_dir.glob("*.yml"):
-                if artifact_file.name.startswith('_'):
-                    print(f"    Skipping template: {artifact_file.name}")
-                    continue
-                    
-                try:
-                    with open(artifact_file, 'r', encoding='utf-8') as f:
-                        artifact = yaml.safe_load(f)
-                        
-                        # Ensure required fields exist
-                        if not artifact:
-                            print(f"     Warning: Empty artifact file {artifact_file}")
-                            continue
-                            
-                        # Add metadata
-                        artifact['id'] = artifact_file.stem
-                        artifact['source_file'] = str(artifact_file)
-                        
-                        # Use category from directory name if not specified
-                        if 'category' not in artifact:
-                            artifact['category'] = category_dir.name
-                        
-                        # Ensure paths is a list
-                        if 'paths' in artifact and isinstance(artifact['paths'], str):
-                            artifact['paths'] = [artifact['paths']]
-                        
-                        # Process enhanced metadata
-                        metadata = artifact.get('metadata', {})
-                        
-                        # Add search-friendly tags
-                        search_tags = []
-                        search_tags.extend(metadata.get('tags', []))
-                        search_tags.extend(metadata.get('investigation_types', []))
-                        search_tags.append(artifact['category'])
-                        if 'criticality' in metadata:
-                            search_tags.append(f"criticality-{metadata['criticality']}")
-                        
-                        artifact['search_tags'] = list(set(search_tags))  # Remove duplicates
-                        
-                        artifacts.append(artifact)
-                        title = artifact.get('title', 'Untitled')
-                        criticality = metadata.get('criticality', 'unknown')
-                        print(f"    Loaded: {title} ({criticality} criticality)")
-                        
-                except Exception as e:
-                    print(f"    Error loading {artifact_file}: {e}")
-    
-    return artifacts
-
-def validate_artifact(artifact):
-    """Basic validation of artifact structure"""
-    required_fields = ['title', 'category', 'description']
-    missing_fields = [field for field in required_fields if field not in artifact]
-    
-    if missing_fields:
-        print(f"   Warning: Missing required fields in {artifact.get('id', 'unknown')}: {missing_fields}")
-        return False
-    
-    return True
-
-def generate_statistics(artifacts):
-    """Generate detailed statistics about artifacts"""
+        return
+    
+    artifact_files, category_logs = find_artifact_files(artifacts_dir)
+    
+    # Reuse previous parse results for files whose mtime has not changed
+    cache = load_build_cache()
+    updated_cache = {}
+    stale_files = []
+    for artifact_file in artifact_files:
+        path = artifact_file[1]
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            # Treat it as stale and let parse_artifact report the error
+            mtime = None
+        entry = cache.get(path)
+        if mtime is not None and entry and entry['mtime'] == mtime:
+            updated_cache[path] = entry
+        else:
+            updated_cache[path] = {'mtime': mtime}
+            stale_files.append(artifact_file)
+    
+    print(f" Reusing {len(artifact_files) - len(stale_files)} cached artifacts, parsing {len(stale_files)}")
+    
+    if len(stale_files) < MIN_PARALLEL_FILES:
+        # Pool startup outweighs the work for a handful of changed files
+        record_parsed(updated_cache, stale_files, map(parse_artifact, stale_files))
+    else:
+        # Parsing is CPU-bound and independent per file, so spread it across cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            record_parsed(updated_cache, stale_files,
+                          executor.map(parse_artifact, stale_files, chunksize=16))
+    
+    save_build_cache(updated_cache)
+    
+    # Emit the per-file log in one write rather than one print per artifact,
+    # keeping each category's header above its artifacts
+    entries = []
+    for category, path in artifact_files:
+        entry = updated_cache[path]
+        entries.append(entry)
+        category_logs[category].append(entry['message'])
+    sys.stdout.write(''.join([f"{line}\n" for log in category_logs.values() for line in log]))
+    
+    for entry in entries:
+        if entry['data'] is not None:
+            yield entry['data']
+
+def process_artifacts(artifacts):
+    """Validate artifacts and generate statistics in a single pass
+    
+    Returns (valid_artifacts, stats, found_categories, total_processed)
+    """
+    valid_artifacts = []
+    found_categories = set()
+    total_processed = 0
     stats = {
-        'total': len(artifacts),
-        'by_category': {},
-        'by_criticality': {},
-        'by_investigation_type': {},
+        'total': 0,
+        'by_category': Counter(),
+        'by_criticality': Counter(),
+        'by_investigation_type': Counter(),
         'windows_versions': set(),
         'tools_count': 0,
         'authors': set()
     }
     
     for artifact in artifacts:
+        total_processed += 1
+        
+        # Basic validation of artifact structure
+        if any(field not in artifact for field in REQUIRED_FIELDS):
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in artifact]
+            print(f"   Warning: Missing required fields in {artifact.get('id', 'unknown')}: {missing_fields}")
+            continue
+        
+        valid_artifacts.append(artifact)
+        
         # Category stats
-        category = artifact.get('category', 'unknown')
-        stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
+        category = artifact['category']
+        stats['by_category'][category] += 1
+        found_categories.add(category)
         
         # Metadata analysis
-        metadata = artifact.get('metadata', {})
+        metadata = artifact.get('metadata') or _EMPTY
         
         # Criticality stats
         criticality = metadata.get('criticality', 'unspecified')
-        stats['by_criticality'][criticality] = stats['by_criticality'].get(criticality, 0) + 1
+        stats['by_criticality'][criticality] += 1
         
         # Investigation types
-        for inv_type in metadata.get('investigation_types', []):
-            stats['by_investigation_type'][inv_type] = stats['by_investigation_type'].get(inv_type, 0) + 1
+        stats['by_investigation_type'].update(metadata.get('investigation_types', ()))
         
         # Windows versions
         for version in metadata.get('windows_versions', []):
             stats['windows_versions'].add(version)
         
-        # Tools count
-        tools = artifact.get('details', {}).get('tools', [])
-        stats['tools_count'] += len(tools)
+        # Tools count (validate.py only warns about malformed sections, so skip them here)
+        details = artifact.get('details')
+        if type(details) is dict:
+            stats['tools_count'] += len(details.get('tools') or ())
         
         # Authors
-        author = artifact.get('author', {})
-        if 'name' in author:
-            stats['authors'].add(author['name'])
+        author = artifact.get('author')
+        if type(author) is dict:
+            author_name = author.get('name')
+            if author_name:
+                stats['authors'].add(author_name)
     
-    # Convert sets to lists for JSON serialization
+    stats['total'] = len(valid_artifacts)
+    
+    # Convert counters to plain dicts and sets to lists for JSON serialization
+    for key in ('by_category', 'by_criticality', 'by_investigation_type'):
+        stats[key] = dict(stats[key])
     stats['windows_versions'] = sorted(list(stats['windows_versions']))
     stats['authors'] = sorted(list(stats['authors']))
     
-    return stats
+    return valid_artifacts, stats, found_categories, total_processed
 
-def build_site():
+def dump_json(value, pretty=False):
+    """Serialize a value to UTF-8 JSON bytes, using orjson when it is installed
+    
+    Output is compact unless pretty is set, in which case it is indented by two spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_site_data(f, artifacts, site_data, pretty=False):
+    """Stream site data to binary file f one artifact at a time instead of serializing the whole document at once"""
+    if pretty:
+        newline, colon = b'\n', b': '
+        item_break, key_break = b'\n    ', b'\n  '
+    else:
+        newline = item_break = key_break = b''
+        colon = b':'
+    
+    # JSON strings never contain raw newlines, so re-indenting nested values is safe
+    f.write(b'{' + key_break + b'"artifacts"' + colon + b'[')
+    for i, artifact in enumerate(artifacts):
+        f.write((b',' if i else b'') + item_break)
+        f.write(dump_json(artifact, pretty).replace(b'\n', item_break))
+    f.write((key_break if artifacts else b'') + b']')
+    
+    for key, value in site_data.items():
+        f.write(b',' + key_break + dump_json(key) + colon)
+        f.write(dump_json(value, pretty).replace(b'\n', key_break))
+    f.write(newline + b'}')
+
+def print_build_report(stats, categories, site_dir, json_file):
+    """Print the build statistics report in a single write"""
+    buf = io.StringIO()
+    print("\n" + "=" * 60, file=buf)
+    print(" Build Statistics:", file=buf)
+    print("=" * 60, file=buf)
+    print(f"Total artifacts: {stats['total']}", file=buf)
+    print(f"Categories: {len(categories)}", file=buf)
+    print(f"Unique tools: {stats['tools_count']}", file=buf)
+    print(f"Contributors: {len(stats['authors'])}", file=buf)
+    
+    print(f"\n By Category:", file=buf)
+    for category, count in sorted(stats['by_category'].items()):
+        print(f"   • {category}: {count} artifacts", file=buf)
+    
+    print(f"\n By Criticality:", file=buf)
+    for criticality, count in sorted(stats['by_criticality'].items()):
+        print(f"   • {criticality}: {count} artifacts", file=buf)
+    
+    print(f"\n Top Investigation Types:", file=buf)
+    top_inv_types = nlargest(5, stats['by_investigation_type'].items(), key=itemgetter(1))
+    for inv_type, count in top_inv_types:
+        print(f"   • {inv_type}: {count} artifacts", file=buf)
+    
+    print(f"\n Windows Versions Covered:", file=buf)
+    for version in stats['windows_versions'][:8]:  # Show first 8
+        print(f"   • {version}", file=buf)
+    if len(stats['windows_versions']) > 8:
+        print(f"   • ... and {len(stats['windows_versions']) - 8} more", file=buf)
+    
+    print(f"\n Output directory: {site_dir}", file=buf)
+    print(f" JSON data: {json_file}", file=buf)
+    print(f" Open site/index.html in your browser to view", file=buf)
+    print("\n Build completed successfully!", file=buf)
+    sys.stdout.write(buf.getvalue())
+
+def build_site(pretty=False):
     """Build the static site with all artifacts"""
     print("=" * 60)
     print(" Building RegSeek...")
     print("=" * 60)
     
-    # Load all artifacts
-    artifacts = load_artifacts()
+    # Load, validate and summarize artifacts in one pass
+    valid_artifacts, stats, found_categories, total_loaded = process_artifacts(load_artifacts())
     
-    if not artifacts:
+    if not total_loaded:
         print(" No artifacts found! Please check your artifacts directory structure.")
         return
     
-    # Validate artifacts
-    valid_artifacts = []
-    for artifact in artifacts:
-        if validate_artifact(artifact):
-            valid_artifacts.append(artifact)
-    
-    print(f"\n Loaded {len(valid_artifacts)} valid artifacts (out of {len(artifacts)} total)")
-    
-    # Generate statistics
-    stats = generate_statistics(valid_artifacts)
+    print(f"\n Loaded {len(valid_artifacts)} valid artifacts (out of {total_loaded} total)")
     
     # Create site data - ensure categories match canonical list
-    all_found_categories = sorted(list(set(a['category'] for a in valid_artifacts)))
+    all_found_categories = sorted(found_categories)
     
     # Canonical categories from validation script
     canonical_categories = [
@@ -176,19 +389,21 @@ def build_site():
     
     print(f" Using {len(categories)} canonical categories: {', '.join(categories)}")
     
-    # Create site data structure
+    # Take one timestamp so both build times agree
+    now = datetime.now(timezone.utc)
+    
+    # Create site data structure (artifacts are streamed separately)
     site_data = {
-        "artifacts": valid_artifacts,
         "categories": categories,
         "statistics": stats,
         "total": len(valid_artifacts),
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now.isoformat(),
         "version": "1.0.0",
         "build_info": {
-            "total_files_processed": len(artifacts),
+            "total_files_processed": total_loaded,
             "valid_artifacts": len(valid_artifacts),
             "categories": len(categories),
-            "built_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "built_at": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
             "builder": "RegSeek Build System v2.0"
         }
     }
@@ -205,44 +420,23 @@ def build_site():
     
     # Write JSON file
     json_file = build_dir / "artifacts.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(site_data, f, indent=2, ensure_ascii=False)
+    with open(json_file, 'wb') as f:
+        write_site_data(f, valid_artifacts, site_data, pretty)
+        json_size = f.tell()
     
     print(f"\n Built artifacts data: {json_file}")
-    print(f" Size: {json_file.stat().st_size:,} bytes")
+    print(f" Size: {json_size:,} bytes")
     
     # Generate statistics report
-    print("\n" + "=" * 60)
-    print(" Build Statistics:")
-    print("=" * 60)
-    print(f"Total artifacts: {stats['total']}")
-    print(f"Categories: {len(categories)}")
-    print(f"Unique tools: {stats['tools_count']}")
-    print(f"Contributors: {len(stats['authors'])}")
-    
-    print(f"\n By Category:")
-    for category, count in sorted(stats['by_category'].items()):
-        print(f"   • {category}: {count} artifacts")
-    
-    print(f"\n By Criticality:")
-    for criticality, count in sorted(stats['by_criticality'].items()):
-        print(f"   • {criticality}: {count} artifacts")
-    
-    print(f"\n Top Investigation Types:")
-    sorted_inv_types = sorted(stats['by_investigation_type'].items(), key=lambda x: x[1], reverse=True)
-    for inv_type, count in sorted_inv_types[:5]:
-        print(f"   • {inv_type}: {count} artifacts")
-    
-    print(f"\n Windows Versions Covered:")
-    for version in stats['windows_versions'][:8]:  # Show first 8
-        print(f"   • {version}")
-    if len(stats['windows_versions']) > 8:
-        print(f"   • ... and {len(stats['windows_versions']) - 8} more")
-    
-    print(f"\n Output directory: {site_dir}")
-    print(f" JSON data: {json_file}")
-    print(f" Open site/index.html in your browser to view")
-    print("\n Build completed successfully!")
+    print_build_report(stats, categories, site_dir, json_file)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Build RegSeek site data from YAML artifacts")
+    parser.add_argument('--pretty', action='store_true',
+                        help="indent artifacts.json for debugging (compact by default)")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    build_site()
+    args = parse_args()
+    build_site(pretty=args.pretty)
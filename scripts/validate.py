@@ -4,12 +4,24 @@ RegSeek Validation System v2.0
 Comprehensive validation of artifact YAML files against RegSeek standards
 """
 
+import argparse
+import hashlib
+import io
+import json
+import os
 import yaml
 import sys
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Tuple, Optional
+from datetime import date
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # Configuration Constants
 VALID_CATEGORIES = [
@@ -37,18 +49,83 @@ VALID_REGISTRY_PREFIXES = ["HKLM\\", "HKCU\\", "HKCR\\", "HKU\\", "HKCC\\"]
 
 VALID_REFERENCE_TYPES = ["official", "research", "blog", "tool"]
 
+# Precomputed lookups for membership and prefix checks; the lists above keep the display order
+VALID_CATEGORIES_SET = frozenset(VALID_CATEGORIES)
+PRIORITY_CATEGORIES_SET = frozenset(PRIORITY_CATEGORIES)
+VALID_INVESTIGATION_TYPES_SET = frozenset(VALID_INVESTIGATION_TYPES)
+VALID_CRITICALITY_LEVELS_SET = frozenset(VALID_CRITICALITY_LEVELS)
+VALID_REFERENCE_TYPES_SET = frozenset(VALID_REFERENCE_TYPES)
+VALID_REGISTRY_PREFIXES_TUPLE = tuple(VALID_REGISTRY_PREFIXES)
+
+# Pre-joined choices for error messages
+VALID_CATEGORIES_TEXT = ', '.join(VALID_CATEGORIES)
+VALID_INVESTIGATION_TYPES_TEXT = ', '.join(VALID_INVESTIGATION_TYPES)
+VALID_CRITICALITY_LEVELS_TEXT = ', '.join(VALID_CRITICALITY_LEVELS)
+VALID_REGISTRY_PREFIXES_TEXT = ', '.join(VALID_REGISTRY_PREFIXES)
+VALID_REFERENCE_TYPES_TEXT = ', '.join(VALID_REFERENCE_TYPES)
+
 # Validation Rules
 MIN_TITLE_LENGTH = 5
 MIN_DESCRIPTION_LENGTH = 10
 MIN_DETAILED_FIELD_LENGTH = 20
-DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 URL_PATTERN = re.compile(r'^https?://[^\s<>"{}|\\^`\[\]]+$')
 
+# Bound match methods, looked up once instead of on every tool and reference
+_email_match = EMAIL_PATTERN.match
+_url_match = URL_PATTERN.match
+
+# Distinguishes an absent key from one explicitly set to null
+_MISSING = object()
+
+def _is_iso_date(value: str) -> bool:
+    """Check for a YYYY-MM-DD date without going through the regex engine"""
+    return (len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and value[0:4].isdecimal() and value[5:7].isdecimal() and value[8:10].isdecimal())
+
+def _is_date_value(value: Any) -> bool:
+    """Check a date field, accepting dates the YAML loader already parsed"""
+    if type(value) is str:
+        return _is_iso_date(value)
+    # Unquoted YYYY-MM-DD scalars load as date; datetime means a time was given too
+    return type(value) is date
+
+# Fields checked in each section, with their warning text built once instead of per file
+REQUIRED_FIELDS = ('title', 'category', 'description', 'paths')
+DETAIL_FIELDS = {
+    'what': 'explanation of what Windows stores',
+    'forensic_value': 'forensic significance explanation',
+    'structure': 'data format and structure description'
+}
+METADATA_DATE_FIELDS = ('introduced', 'deprecated')
+CONTRIBUTION_DATE_FIELDS = ('date_added', 'last_updated')
+
+MISSING_FIELD_MESSAGES = {field: f"Missing required field: '{field}'" for field in REQUIRED_FIELDS}
+EMPTY_FIELD_MESSAGES = {field: f"Field '{field}' cannot be empty" for field in REQUIRED_FIELDS}
+MISSING_DETAIL_MESSAGES = {field: f"Missing details.{field} ({description})"
+                           for field, description in DETAIL_FIELDS.items()}
+SHORT_DETAIL_MESSAGES = {field: f"details.{field} should be more detailed (at least {MIN_DETAILED_FIELD_LENGTH} characters)"
+                         for field in DETAIL_FIELDS}
+METADATA_DATE_MESSAGES = {field: f"metadata.{field} should be in YYYY-MM-DD format"
+                          for field in METADATA_DATE_FIELDS}
+CONTRIBUTION_DATE_MESSAGES = {field: f"contribution.{field} should be in YYYY-MM-DD format"
+                              for field in CONTRIBUTION_DATE_FIELDS}
+
+# Directory validation only uses a process pool from this many files up
+MIN_PARALLEL_FILES = 8
+
+# Results are cached per file; editing this script or bumping the version discards the cache
+VALIDATION_CACHE_FILE = os.path.join(".regseek_cache", "validate.json")
+VALIDATION_CACHE_VERSION = 2
+
 class ValidationResult:
     """Store validation results"""
+    __slots__ = ('file_path', 'category', 'is_valid', 'errors', 'warnings', 'recommendations')
+    
     def __init__(self, file_path: str):
         self.file_path = file_path
+        # Category is the parent directory name, if the path has one
+        self.category = os.path.basename(os.path.dirname(file_path)) or None
         self.is_valid = True
         self.errors = []
         self.warnings = []
@@ -59,6 +136,11 @@ class ValidationResult:
         self.errors.append(message)
         self.is_valid = False
         
+    def add_errors(self, *messages: str):
+        """Add several related validation errors at once"""
+        self.errors.extend(messages)
+        self.is_valid = False
+        
     def add_warning(self, message: str):
         """Add validation warning"""
         self.warnings.append(message)
@@ -66,40 +148,122 @@ class ValidationResult:
     def add_recommendation(self, message: str):
         """Add recommendation for improvement"""
         self.recommendations.append(message)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict for the result cache"""
+        return {
+            'file_path': self.file_path,
+            'is_valid': self.is_valid,
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'recommendations': self.recommendations
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationResult':
+        """Rebuild a result stored by to_dict"""
+        result = cls(data['file_path'])
+        result.is_valid = data['is_valid']
+        result.errors = data['errors']
+        result.warnings = data['warnings']
+        result.recommendations = data['recommendations']
+        return result
+
+def _content_hash(data: bytes) -> str:
+    """Hash file contents for cache keys; blake2b is fast and plenty for change detection"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _cache_signature() -> str:
+    """Identify the validator version so cached results are dropped when the rules change"""
+    # Hash the source rather than use its mtime, which a fresh checkout always resets
+    with open(__file__, 'rb') as f:
+        return f"{VALIDATION_CACHE_VERSION}:{_content_hash(f.read())}"
+
+def load_validation_cache() -> Dict[str, Any]:
+    """Load cached validation results, keyed by file path"""
+    try:
+        with open(VALIDATION_CACHE_FILE, 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+        
+    if cache.get('signature') != _cache_signature():
+        return {}
+        
+    return cache.get('files', {})
+
+def save_validation_cache(files: Dict[str, Any]):
+    """Persist cached validation results for the next run"""
+    # Swap the new cache in whole so an interrupted run never leaves it truncated
+    os.makedirs(os.path.dirname(VALIDATION_CACHE_FILE), exist_ok=True)
+    tmp_file = VALIDATION_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'signature': _cache_signature(), 'files': files}, f, ensure_ascii=False)
+    os.replace(tmp_file, VALIDATION_CACHE_FILE)
 
 class ArtifactValidator:
-    """Comprehensive artifact validator"""
+    """Comprehensive artifact validator
+    
+    When a cache dict is given, results for files whose contents are
+    unchanged are reused instead of re-validating them.
+    """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[Dict[str, Any]] = None):
         self.results = []
+        self.cache = cache
+        
+    def get_cached_result(self, file_path: Path, data: bytes) -> Tuple[Optional[ValidationResult], str]:
+        """Return the cached result for an unchanged file (or None) and the signature of data"""
+        signature = _content_hash(data)
+        entry = self.cache.get(str(file_path))
+        if entry and entry['signature'] == signature:
+            return ValidationResult.from_dict(entry['result']), signature
+        return None, signature
+        
+    def store_cached_result(self, file_path: Path, signature: str, result: ValidationResult):
+        """Remember a fresh result for the file state described by signature"""
+        self.cache[str(file_path)] = {'signature': signature, 'result': result.to_dict()}
         
     def validate_required_fields(self, artifact: Dict[str, Any], result: ValidationResult):
         """Validate required top-level fields"""
-        required_fields = {
-            'title': str,
-            'category': str,
-            'description': str,
-            'paths': (list, str)  # Can be list or string
-        }
-        
-        for field, expected_type in required_fields.items():
-            if field not in artifact:
-                result.add_error(f"Missing required field: '{field}'")
-                continue
-                
-            value = artifact[field]
-            if not isinstance(value, expected_type):
-                result.add_error(f"Field '{field}' must be {expected_type.__name__}, got {type(value).__name__}")
-                continue
-                
-            # String length validation
-            if isinstance(value, str):
-                if field == 'title' and len(value) < MIN_TITLE_LENGTH:
-                    result.add_error(f"Title must be at least {MIN_TITLE_LENGTH} characters, got {len(value)}")
-                elif field == 'description' and len(value) < MIN_DESCRIPTION_LENGTH:
-                    result.add_error(f"Description must be at least {MIN_DESCRIPTION_LENGTH} characters, got {len(value)}")
-                elif not value.strip():
-                    result.add_error(f"Field '{field}' cannot be empty")
+        # Unrolled per field: the string fast path costs one type() check each
+        title = artifact.get('title', _MISSING)
+        if title is _MISSING:
+            result.add_error(MISSING_FIELD_MESSAGES['title'])
+        elif type(title) is not str:
+            result.add_error(f"Field 'title' must be str, got {type(title).__name__}")
+        elif len(title) < MIN_TITLE_LENGTH:
+            result.add_error(f"Title must be at least {MIN_TITLE_LENGTH} characters, got {len(title)}")
+        elif not title.strip():
+            result.add_error(EMPTY_FIELD_MESSAGES['title'])
+            
+        category = artifact.get('category', _MISSING)
+        if category is _MISSING:
+            result.add_error(MISSING_FIELD_MESSAGES['category'])
+        elif type(category) is not str:
+            result.add_error(f"Field 'category' must be str, got {type(category).__name__}")
+        elif not category.strip():
+            result.add_error(EMPTY_FIELD_MESSAGES['category'])
+            
+        description = artifact.get('description', _MISSING)
+        if description is _MISSING:
+            result.add_error(MISSING_FIELD_MESSAGES['description'])
+        elif type(description) is not str:
+            result.add_error(f"Field 'description' must be str, got {type(description).__name__}")
+        elif len(description) < MIN_DESCRIPTION_LENGTH:
+            result.add_error(f"Description must be at least {MIN_DESCRIPTION_LENGTH} characters, got {len(description)}")
+        elif not description.strip():
+            result.add_error(EMPTY_FIELD_MESSAGES['description'])
+            
+        # Paths can be a list or a single string
+        paths = artifact.get('paths', _MISSING)
+        if paths is _MISSING:
+            result.add_error(MISSING_FIELD_MESSAGES['paths'])
+        elif type(paths) is str:
+            if not paths.strip():
+                result.add_error(EMPTY_FIELD_MESSAGES['paths'])
+        elif type(paths) is not list:
+            result.add_error(f"Field 'paths' must be list or str, got {type(paths).__name__}")
     
     def validate_category(self, artifact: Dict[str, Any], result: ValidationResult):
         """Validate category field"""
@@ -107,12 +271,12 @@ class ArtifactValidator:
         if not category:
             return
             
-        if category not in VALID_CATEGORIES:
-            result.add_error(f"Invalid category '{category}'. Must be one of: {', '.join(VALID_CATEGORIES)}")
+        if type(category) is not str or category not in VALID_CATEGORIES_SET:
+            result.add_error(f"Invalid category '{category}'. Must be one of: {VALID_CATEGORIES_TEXT}")
             return
             
         # Check if it's a priority category
-        if category in PRIORITY_CATEGORIES:
+        if category in PRIORITY_CATEGORIES_SET:
             result.add_recommendation(f"Category '{category}' is a priority category (appears in quick filters)")
     
     def validate_paths(self, artifact: Dict[str, Any], result: ValidationResult):
@@ -122,16 +286,16 @@ class ArtifactValidator:
             return
             
         # Convert single path to list
-        if isinstance(paths, str):
+        if type(paths) is str:
             paths = [paths]
             
-        if not isinstance(paths, list) or len(paths) == 0:
+        if type(paths) is not list or len(paths) == 0:
             result.add_error("Paths must be a non-empty list or string")
             return
             
         valid_hives = set()
         for i, path in enumerate(paths):
-            if not isinstance(path, str):
+            if type(path) is not str:
                 result.add_error(f"Path {i+1} must be a string, got {type(path).__name__}")
                 continue
                 
@@ -139,17 +303,12 @@ class ArtifactValidator:
                 result.add_error(f"Path {i+1} cannot be empty")
                 continue
                 
-            # Check registry path format
-            path_valid = False
-            for prefix in VALID_REGISTRY_PREFIXES:
-                if path.startswith(prefix):
-                    path_valid = True
-                    valid_hives.add(prefix.rstrip('\\'))
-                    break
-                    
-            if not path_valid:
+            # Check registry path format; every prefix ends at the first backslash
+            if path.startswith(VALID_REGISTRY_PREFIXES_TUPLE):
+                valid_hives.add(path.split('\\', 1)[0])
+            else:
                 result.add_warning(f"Path may not be valid registry path: '{path}'")
-                result.add_recommendation(f"Registry paths should start with: {', '.join(VALID_REGISTRY_PREFIXES)}")
+                result.add_recommendation(f"Registry paths should start with: {VALID_REGISTRY_PREFIXES_TEXT}")
         
         # Add recommendation about hive diversity
         if len(valid_hives) > 1:
@@ -164,33 +323,27 @@ class ArtifactValidator:
             return
             
         # Check for detailed explanations
-        detail_fields = {
-            'what': 'explanation of what Windows stores',
-            'forensic_value': 'forensic significance explanation',
-            'structure': 'data format and structure description'
-        }
-        
-        for field, description in detail_fields.items():
+        for field in DETAIL_FIELDS:
             value = details.get(field)
             if not value:
-                result.add_warning(f"Missing details.{field} ({description})")
-            elif isinstance(value, str) and len(value.strip()) < MIN_DETAILED_FIELD_LENGTH:
-                result.add_warning(f"details.{field} should be more detailed (at least {MIN_DETAILED_FIELD_LENGTH} characters)")
+                result.add_warning(MISSING_DETAIL_MESSAGES[field])
+            elif type(value) is str and len(value.strip()) < MIN_DETAILED_FIELD_LENGTH:
+                result.add_warning(SHORT_DETAIL_MESSAGES[field])
         
         # Check examples
         examples = details.get('examples')
         if not examples:
             result.add_warning("Missing details.examples (recommended)")
-        elif isinstance(examples, list) and len(examples) == 0:
+        elif type(examples) is list and len(examples) == 0:
             result.add_warning("Examples list is empty")
-        elif not isinstance(examples, list):
+        elif type(examples) is not list:
             result.add_warning("Examples should be a list of strings")
         
         # Check tools
         tools = details.get('tools')
         if not tools:
             result.add_warning("Missing details.tools (recommended)")
-        elif isinstance(tools, list):
+        elif type(tools) is list:
             self.validate_tools(tools, result)
         else:
             result.add_warning("Tools should be a list")
@@ -202,7 +355,7 @@ class ArtifactValidator:
             return
             
         for i, tool in enumerate(tools):
-            if not isinstance(tool, dict):
+            if type(tool) is not dict:
                 result.add_warning(f"Tool {i+1} should be an object with 'name' field")
                 continue
                 
@@ -211,7 +364,7 @@ class ArtifactValidator:
                 continue
                 
             name = tool['name']
-            if not isinstance(name, str) or not name.strip():
+            if type(name) is not str or not name.strip():
                 result.add_error(f"Tool {i+1} name must be a non-empty string")
                 continue
                 
@@ -220,7 +373,7 @@ class ArtifactValidator:
                 result.add_recommendation(f"Tool '{name}' missing URL (recommended)")
             else:
                 url = tool['url']
-                if not isinstance(url, str) or not URL_PATTERN.match(url):
+                if type(url) is not str or not _url_match(url):
                     result.add_warning(f"Tool '{name}' has invalid URL format")
     
     def validate_metadata_section(self, artifact: Dict[str, Any], result: ValidationResult):
@@ -235,18 +388,18 @@ class ArtifactValidator:
         criticality = metadata.get('criticality')
         if not criticality:
             result.add_recommendation("Missing metadata.criticality (recommended)")
-        elif criticality not in VALID_CRITICALITY_LEVELS:
-            result.add_error(f"Invalid criticality '{criticality}'. Must be one of: {', '.join(VALID_CRITICALITY_LEVELS)}")
+        elif type(criticality) is not str or criticality not in VALID_CRITICALITY_LEVELS_SET:
+            result.add_error(f"Invalid criticality '{criticality}'. Must be one of: {VALID_CRITICALITY_LEVELS_TEXT}")
         
         # Investigation types validation
         inv_types = metadata.get('investigation_types', [])
         if not inv_types:
             result.add_recommendation("Missing metadata.investigation_types (recommended)")
-        elif isinstance(inv_types, list):
-            invalid_types = [t for t in inv_types if t not in VALID_INVESTIGATION_TYPES]
+        elif type(inv_types) is list:
+            invalid_types = [t for t in inv_types if type(t) is not str or t not in VALID_INVESTIGATION_TYPES_SET]
             if invalid_types:
-                result.add_error(f"Invalid investigation types: {', '.join(invalid_types)}")
-                result.add_error(f"Valid types: {', '.join(VALID_INVESTIGATION_TYPES)}")
+                result.add_errors(f"Invalid investigation types: {', '.join(map(str, invalid_types))}",
+                                  f"Valid types: {VALID_INVESTIGATION_TYPES_TEXT}")
         else:
             result.add_error("investigation_types must be a list")
         
@@ -254,25 +407,24 @@ class ArtifactValidator:
         win_versions = metadata.get('windows_versions')
         if not win_versions:
             result.add_recommendation("Missing metadata.windows_versions (recommended)")
-        elif not isinstance(win_versions, list):
+        elif type(win_versions) is not list:
             result.add_warning("windows_versions should be a list")
         
         # References validation
         references = metadata.get('references', [])
-        if isinstance(references, list):
+        if type(references) is list:
             self.validate_references(references, result)
         
         # Date fields validation
-        date_fields = ['introduced', 'deprecated']
-        for field in date_fields:
+        for field in METADATA_DATE_FIELDS:
             date_value = metadata.get(field)
-            if date_value and not DATE_PATTERN.match(str(date_value)):
-                result.add_warning(f"metadata.{field} should be in YYYY-MM-DD format")
+            if date_value and not _is_date_value(date_value):
+                result.add_warning(METADATA_DATE_MESSAGES[field])
     
     def validate_references(self, references: List[Any], result: ValidationResult):
         """Validate references list"""
         for i, ref in enumerate(references):
-            if not isinstance(ref, dict):
+            if type(ref) is not dict:
                 result.add_warning(f"Reference {i+1} should be an object")
                 continue
                 
@@ -283,13 +435,13 @@ class ArtifactValidator:
             # Check URL format
             if 'url' in ref:
                 url = ref['url']
-                if not isinstance(url, str) or not URL_PATTERN.match(url):
+                if type(url) is not str or not _url_match(url):
                     result.add_warning(f"Reference {i+1} has invalid URL format")
             
             # Check reference type
             ref_type = ref.get('type')
-            if ref_type and ref_type not in VALID_REFERENCE_TYPES:
-                result.add_warning(f"Reference {i+1} invalid type '{ref_type}'. Valid types: {', '.join(VALID_REFERENCE_TYPES)}")
+            if ref_type and (type(ref_type) is not str or ref_type not in VALID_REFERENCE_TYPES_SET):
+                result.add_warning(f"Reference {i+1} invalid type '{ref_type}'. Valid types: {VALID_REFERENCE_TYPES_TEXT}")
     
     def validate_author_section(self, artifact: Dict[str, Any], result: ValidationResult):
         """Validate author section"""
@@ -299,18 +451,18 @@ class ArtifactValidator:
             result.add_recommendation("Missing 'author' section (recommended for attribution)")
             return
             
-        if not isinstance(author, dict):
+        if type(author) is not dict:
             result.add_warning("Author should be an object with name, contact info")
             return
             
         if 'name' not in author:
             result.add_warning("Author missing 'name' field")
-        elif not isinstance(author['name'], str) or not author['name'].strip():
+        elif type(author['name']) is not str or not author['name'].strip():
             result.add_warning("Author name should be a non-empty string")
         
         # Email validation
         email = author.get('email')
-        if email and not EMAIL_PATTERN.match(email):
+        if email and not _email_match(email):
             result.add_warning("Author email format appears invalid")
     
     def validate_contribution_section(self, artifact: Dict[str, Any], result: ValidationResult):
@@ -321,62 +473,60 @@ class ArtifactValidator:
             result.add_recommendation("Missing 'contribution' section (recommended for tracking)")
             return
             
-        if not isinstance(contribution, dict):
+        if type(contribution) is not dict:
             result.add_warning("Contribution should be an object")
             return
             
         # Date validation
-        date_fields = ['date_added', 'last_updated']
-        for field in date_fields:
+        for field in CONTRIBUTION_DATE_FIELDS:
             date_value = contribution.get(field)
-            if date_value and not DATE_PATTERN.match(str(date_value)):
-                result.add_warning(f"contribution.{field} should be in YYYY-MM-DD format")
+            if date_value and not _is_date_value(date_value):
+                result.add_warning(CONTRIBUTION_DATE_MESSAGES[field])
     
     def validate_anti_checklist_methodology(self, artifact: Dict[str, Any], result: ValidationResult):
         """Validate anti-checklist methodology sections (CRITICAL)"""
-        # Limitations section
+        # Limitations section; the well-formed case is checked first
         limitations = artifact.get('limitations')
-        if not limitations:
-            result.add_error("CRITICAL: Missing 'limitations' section (anti-checklist methodology)")
-            result.add_error("Must specify what this artifact CANNOT determine or prove")
-        elif isinstance(limitations, list):
-            if len(limitations) == 0:
-                result.add_warning("Limitations list is empty")
-            else:
-                result.add_recommendation(f"Good: {len(limitations)} limitation(s) specified")
+        if type(limitations) is list and limitations:
+            result.add_recommendation(f"Good: {len(limitations)} limitation(s) specified")
+        elif not limitations:
+            result.add_errors("CRITICAL: Missing 'limitations' section (anti-checklist methodology)",
+                              "Must specify what this artifact CANNOT determine or prove")
         else:
             result.add_warning("Limitations should be a list of strings")
         
         # Correlation section
         correlation = artifact.get('correlation')
-        if not correlation:
-            result.add_error("CRITICAL: Missing 'correlation' section (anti-checklist methodology)")
-            result.add_error("Must specify required evidence for definitive conclusions")
-        elif isinstance(correlation, dict):
-            required = correlation.get('required_for_definitive_conclusions')
-            strengthens = correlation.get('strengthens_evidence')
-            
-            if not required and not strengthens:
-                result.add_warning("Correlation section empty - should specify required evidence")
-            else:
+        if type(correlation) is dict and correlation:
+            if correlation.get('required_for_definitive_conclusions') or correlation.get('strengthens_evidence'):
                 result.add_recommendation("Good: Correlation requirements specified")
+            else:
+                result.add_warning("Correlation section empty - should specify required evidence")
+        elif not correlation:
+            result.add_errors("CRITICAL: Missing 'correlation' section (anti-checklist methodology)",
+                              "Must specify required evidence for definitive conclusions")
         else:
             result.add_warning("Correlation should be an object with required/strengthens fields")
     
-    def validate_file(self, file_path: Path) -> ValidationResult:
-        """Validate a single artifact file"""
+    def validate_file(self, file_path: Path, data: Optional[bytes] = None) -> ValidationResult:
+        """Validate a single artifact file, parsing data instead of re-reading the file when given"""
         result = ValidationResult(str(file_path))
         
         try:
             # Load YAML
-            with open(file_path, 'r', encoding='utf-8') as f:
-                artifact = yaml.safe_load(f)
+            if data is None:
+                with open(file_path, 'rb') as f:
+                    artifact = yaml.load(f, Loader=SafeLoader)
+            else:
+                stream = io.BytesIO(data)
+                stream.name = str(file_path)  # keeps the file name in parse error marks
+                artifact = yaml.load(stream, Loader=SafeLoader)
                 
             if not artifact:
                 result.add_error("File is empty or contains invalid YAML")
                 return result
                 
-            if not isinstance(artifact, dict):
+            if type(artifact) is not dict:
                 result.add_error("Root element must be a YAML object/dictionary")
                 return result
             
@@ -397,211 +547,332 @@ class ArtifactValidator:
             
         return result
     
-    def validate_directory(self, artifacts_dir: Path = None) -> List[ValidationResult]:
-        """Validate all artifacts in directory"""
+    def validate_directory(self, artifacts_dir: Path = None) -> Iterator[ValidationResult]:
+        """Validate all artifacts in directory, yielding results one file at a time"""
         if artifacts_dir is None:
             artifacts_dir = Path("artifacts")
             
         if not artifacts_dir.exists():
             result = ValidationResult(str(artifacts_dir))
             result.add_error("Artifacts directory not found")
-            return [result]
+            yield result
+            return
         
-        results = []
+        artifact_files = []
         
-        for category_dir in artifacts_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith('_'):
-                continue
-                
-            for artifact_file in category_dir.glob("*.yml"):
-                if artifact_file.name.startswith('_'):
+        # DirEntry caches the type from the directory read, so no extra stat per entry
+        with os.scandir(artifacts_dir) as categories_it:
+            category_paths = [entry.path for entry in categories_it
+                              if entry.is_dir() and not entry.name.startswith(('_', '.'))]
+        
+        for category_path in category_paths:
+            with os.scandir(category_path) as files_it:
+                for entry in files_it:
+                    # Hidden files are editor swap files and OS metadata, not artifacts
+                    if entry.name.endswith('.yml') and not entry.name.startswith(('_', '.')):
+                        artifact_files.append(Path(entry.path))
+        
+        yield from self.validate_files(artifact_files)
+        
+        # A full run saw every artifact, so drop entries for deleted or renamed files
+        if self.cache is not None:
+            current = {str(artifact_file) for artifact_file in artifact_files}
+            for path in [path for path in self.cache if path not in current]:
+                del self.cache[path]
+        
+    def validate_files(self, artifact_files: List[Path]) -> Iterator[ValidationResult]:
+        """Validate the given artifact files, yielding results in the same order"""
+        # Only files that changed since the cached run need validating
+        cached = {}
+        if self.cache is None:
+            stale_files = artifact_files
+            stale_data = [None] * len(artifact_files)
+        else:
+            stale_files = []
+            stale_data = []
+            for artifact_file in artifact_files:
+                # Read each file once: the bytes feed both the hash and, on a miss, the parser
+                try:
+                    with open(artifact_file, 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    # Let validate_file report the read error; it is never cached
+                    stale_files.append(artifact_file)
+                    stale_data.append(None)
                     continue
-                    
-                result = self.validate_file(artifact_file)
-                results.append(result)
+                result, signature = cached[artifact_file] = self.get_cached_result(artifact_file, data)
+                if result is None:
+                    stale_files.append(artifact_file)
+                    stale_data.append(data)
+        
+        # Pool startup outweighs the work for a handful of files
+        if len(stale_files) < MIN_PARALLEL_FILES:
+            fresh = map(self.validate_file, stale_files, stale_data)
+            yield from self._merge_results(artifact_files, cached, fresh)
+            return
+        
+        # Files are independent, so validate them across all cores
+        with ProcessPoolExecutor(initializer=_init_worker) as executor:
+            fresh = executor.map(_validate_one, stale_files, stale_data, chunksize=16)
+            yield from self._merge_results(artifact_files, cached, fresh)
+            
+    def _merge_results(self, artifact_files: List[Path], cached: Dict[Path, Any],
+                       fresh: Iterator[ValidationResult]) -> Iterator[ValidationResult]:
+        """Yield results in directory order, taking cache misses from fresh"""
+        for artifact_file in artifact_files:
+            result, signature = cached.get(artifact_file, (None, None))
+            if result is None:
+                result = next(fresh)
+                if signature is not None:
+                    self.store_cached_result(artifact_file, signature, result)
+            yield result
+
+# Per-process validator, set up once by _init_worker before any file is dispatched
+_worker_validator = None
+
+def _init_worker():
+    """Create the validator a worker process reuses for every file it handles"""
+    global _worker_validator
+    _worker_validator = ArtifactValidator()
+
+def _validate_one(file_path: Path, data: Optional[bytes] = None) -> ValidationResult:
+    """Validate a single file in a worker process"""
+    return _worker_validator.validate_file(file_path, data)
+
+class ValidationSummary:
+    """Running totals folded from a stream of validation results
+    
+    Only invalid results (and valid ones when show_all is set) are kept,
+    everything else is reduced to counters as results arrive.
+    """
+    MAX_CRITICAL_ISSUES = 10
+    
+    def __init__(self, show_all: bool = False):
+        self.show_all = show_all
+        self.total_files = 0
+        self.valid_files = 0
+        self.perfect_files = 0
+        self.total_errors = 0
+        self.total_warnings = 0
+        self.total_recommendations = 0
+        self.critical_count = 0
+        self.categories = Counter()
+        self.warning_counts = Counter()
+        self.warning_types = {}
+        self.critical_issues = []
+        self.invalid_results = []
+        self.valid_results = []
+        
+    def add(self, result: ValidationResult):
+        """Fold a single validation result into the summary"""
+        self.total_files += 1
+        self.total_errors += len(result.errors)
+        self.total_warnings += len(result.warnings)
+        self.total_recommendations += len(result.recommendations)
+        
+        if result.is_valid:
+            self.valid_files += 1
+            if not result.warnings and not result.recommendations:
+                self.perfect_files += 1
+            if self.show_all:
+                self.valid_results.append(result)
+                
+            if result.category:
+                self.categories[result.category] += 1
+        else:
+            self.invalid_results.append(result)
+        
+        # Critical issues (anti-checklist methodology), keeping only the first few
+        for error in result.errors:
+            if error.startswith("CRITICAL:"):
+                self.critical_count += 1
+                if len(self.critical_issues) < self.MAX_CRITICAL_ISSUES:
+                    self.critical_issues.append(f"{Path(result.file_path).name}: {error}")
         
-        return results
+        for warning in result.warnings:
+            # Extract warning type; most messages repeat across files, so parse each text once
+            warning_type = self.warning_types.get(warning)
+            if warning_type is None:
+                warning_type = self.warning_types[warning] = warning.split('(')[0].strip()
+            self.warning_counts[warning_type] += 1
+
+def summarize_results(results: Iterable[ValidationResult], show_all: bool = False) -> ValidationSummary:
+    """Consume validation results in a single pass"""
+    summary = ValidationSummary(show_all)
+    for result in results:
+        summary.add(result)
+    return summary
 
-def print_validation_summary(results: List[ValidationResult]):
+def print_validation_summary(summary: ValidationSummary):
     """Print comprehensive validation summary"""
-    total_files = len(results)
-    valid_files = sum(1 for r in results if r.is_valid)
+    buf = io.StringIO()
+    total_files = summary.total_files
+    valid_files = summary.valid_files
     invalid_files = total_files - valid_files
-    total_errors = sum(len(r.errors) for r in results)
-    total_warnings = sum(len(r.warnings) for r in results)
-    total_recommendations = sum(len(r.recommendations) for r in results)
     
-    print("\n" + "=" * 70)
-    print(" VALIDATION SUMMARY")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    print(" VALIDATION SUMMARY", file=buf)
+    print("=" * 70, file=buf)
     
     # Overall stats
-    print(f" STATISTICS:")
-    print(f"   Files validated: {total_files}")
-    print(f"   Valid: {valid_files}")
-    print(f"   Invalid: {invalid_files}")
-    print(f"   Total errors: {total_errors}")
-    print(f"   Total warnings: {total_warnings}")
-    print(f"   Total recommendations: {total_recommendations}")
+    print(f" STATISTICS:", file=buf)
+    print(f"   Files validated: {total_files}", file=buf)
+    print(f"   Valid: {valid_files}", file=buf)
+    print(f"   Invalid: {invalid_files}", file=buf)
+    print(f"   Total errors: {summary.total_errors}", file=buf)
+    print(f"   Total warnings: {summary.total_warnings}", file=buf)
+    print(f"   Total recommendations: {summary.total_recommendations}", file=buf)
     
     if total_files > 0:
         success_rate = round((valid_files / total_files) * 100, 1)
-        print(f"   Success rate: {success_rate}%")
+        print(f"   Success rate: {success_rate}%", file=buf)
     
     # Categories
-    categories = {}
-    for result in results:
-        if result.is_valid:
-            # Extract category from path
-            path_parts = Path(result.file_path).parts
-            if len(path_parts) >= 2:
-                category = path_parts[-2]  # Parent directory name
-                categories[category] = categories.get(category, 0) + 1
-    
-    if categories:
-        print(f"\n VALID ARTIFACTS BY CATEGORY:")
-        for category, count in sorted(categories.items()):
-            priority_marker = "⭐" if category in PRIORITY_CATEGORIES else "  "
-            print(f"   {priority_marker} {category}: {count}")
+    if summary.categories:
+        print(f"\n VALID ARTIFACTS BY CATEGORY:", file=buf)
+        for category, count in sorted(summary.categories.items()):
+            priority_marker = "⭐" if category in PRIORITY_CATEGORIES_SET else "  "
+            print(f"   {priority_marker} {category}: {count}", file=buf)
     
     # Critical issues (anti-checklist methodology)
-    critical_issues = []
-    for result in results:
-        for error in result.errors:
-            if "CRITICAL" in error:
-                critical_issues.append(f"{Path(result.file_path).name}: {error}")
-    
-    if critical_issues:
-        print(f"\n CRITICAL ISSUES (Anti-Checklist Methodology):")
-        for issue in critical_issues[:10]:  # Show first 10
-            print(f"   • {issue}")
-        if len(critical_issues) > 10:
-            print(f"   ... and {len(critical_issues) - 10} more critical issues")
+    if summary.critical_issues:
+        print(f"\n CRITICAL ISSUES (Anti-Checklist Methodology):", file=buf)
+        for issue in summary.critical_issues:
+            print(f"   • {issue}", file=buf)
+        if summary.critical_count > len(summary.critical_issues):
+            print(f"   ... and {summary.critical_count - len(summary.critical_issues)} more critical issues", file=buf)
     
     # Most common warnings
-    warning_counts = {}
-    for result in results:
-        for warning in result.warnings:
-            # Extract warning type
-            warning_type = warning.split('(')[0].strip()
-            warning_counts[warning_type] = warning_counts.get(warning_type, 0) + 1
+    if summary.warning_counts:
+        print(f"\n COMMON WARNINGS:", file=buf)
+        for warning_type, count in summary.warning_counts.most_common(5):
+            print(f"   • {warning_type}: {count} files", file=buf)
     
-    if warning_counts:
-        print(f"\n COMMON WARNINGS:")
-        sorted_warnings = sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)
-        for warning_type, count in sorted_warnings[:5]:
-            print(f"   • {warning_type}: {count} files")
+    sys.stdout.write(buf.getvalue())
 
-def print_file_results(results: List[ValidationResult], show_all: bool = False):
+def print_file_results(summary: ValidationSummary):
     """Print individual file validation results"""
-    if not results:
+    if not summary.total_files:
         return
         
-    print("\n" + "=" * 70)
-    print(" FILE VALIDATION RESULTS")
-    print("=" * 70)
+    buf = io.StringIO()
+    print("\n" + "=" * 70, file=buf)
+    print(" FILE VALIDATION RESULTS", file=buf)
+    print("=" * 70, file=buf)
     
-    # Group by status
-    valid_results = [r for r in results if r.is_valid]
-    invalid_results = [r for r in results if not r.is_valid]
+    invalid_results = summary.invalid_results
     
     # Show invalid files first
     if invalid_results:
-        print(f"\n INVALID FILES ({len(invalid_results)}):")
+        print(f"\n INVALID FILES ({len(invalid_results)}):", file=buf)
         for result in invalid_results:
             file_name = Path(result.file_path).name
-            print(f"\n   {file_name}")
+            print(f"\n   {file_name}", file=buf)
             
             for error in result.errors:
-                print(f"      {error}")
+                print(f"      {error}", file=buf)
                 
             if result.warnings:
                 for warning in result.warnings[:3]:  # Limit warnings for invalid files
-                    print(f"       {warning}")
+                    print(f"       {warning}", file=buf)
                 if len(result.warnings) > 3:
-                    print(f"       ... and {len(result.warnings) - 3} more warnings")
+                    print(f"       ... and {len(result.warnings) - 3} more warnings", file=buf)
     
     # Show valid files (summary or detailed)
-    if valid_results:
-        if show_all:
-            print(f"\n VALID FILES ({len(valid_results)}):")
-            for result in valid_results:
+    if summary.valid_files:
+        if summary.show_all:
+            print(f"\n VALID FILES ({summary.valid_files}):", file=buf)
+            for result in summary.valid_results:
                 file_name = Path(result.file_path).name
                 issue_count = len(result.warnings) + len(result.recommendations)
                 
                 if issue_count == 0:
-                    print(f"    {file_name} - Perfect!")
+                    print(f"    {file_name} - Perfect!", file=buf)
                 else:
-                    print(f"    {file_name} - {len(result.warnings)} warnings, {len(result.recommendations)} recommendations")
+                    print(f"    {file_name} - {len(result.warnings)} warnings, {len(result.recommendations)} recommendations", file=buf)
                     
                     for warning in result.warnings:
-                        print(f"       {warning}")
+                        print(f"       {warning}", file=buf)
                         
                     for rec in result.recommendations:
-                        print(f"      {rec}")
+                        print(f"      {rec}", file=buf)
         else:
-            print(f"\n VALID FILES: {len(valid_results)} files passed validation")
-            perfect_files = [r for r in valid_results if len(r.warnings) == 0 and len(r.recommendations) == 0]
-            if perfect_files:
-                print(f"   {len(perfect_files)} files are perfect (no warnings or recommendations)")
+            print(f"\n VALID FILES: {summary.valid_files} files passed validation", file=buf)
+            if summary.perfect_files:
+                print(f"   {summary.perfect_files} files are perfect (no warnings or recommendations)", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate RegSeek artifact YAML files")
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help="artifact files to validate (default: every artifact in artifacts/)")
+    parser.add_argument('--detailed', '-d', action='store_true',
+                        help="show warnings and recommendations for valid files too")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="revalidate every file instead of reusing cached results")
+    return parser.parse_args()
 
 def main():
     """Main validation function"""
+    args = parse_args()
+    show_detailed = args.detailed
+    
     print(" RegSeek Validation System v2.0")
     print("=" * 70)
     
-    # Parse command line arguments
-    show_detailed = '--detailed' in sys.argv or '-d' in sys.argv
-    file_path = None
-    
-    # Check for specific file argument
-    for arg in sys.argv[1:]:
-        if not arg.startswith('-') and arg.endswith('.yml'):
-            file_path = Path(arg)
-            break
-    
     # Initialize validator
-    validator = ArtifactValidator()
+    validator = ArtifactValidator(None if args.no_cache else load_validation_cache())
     
-    if file_path:
-        # Validate single file
-        if not file_path.exists():
-            print(f" File not found: {file_path}")
-            return 1
+    if args.files:
+        # Validate specific files in a single run
+        file_paths = [Path(f) for f in args.files]
+        for file_path in file_paths:
+            if not file_path.is_file():
+                print(f" File not found: {file_path}")
+                return 1
+            print(f" Validating: {file_path}")
             
-        print(f" Validating: {file_path}")
-        result = validator.validate_file(file_path)
-        results = [result]
-        show_detailed = True  # Always show details for single file
+        results = validator.validate_files(file_paths)
+        show_detailed = True  # Always show details for specific files
     else:
         # Validate all files
         print(" Validating all artifacts...")
         results = validator.validate_directory()
     
-    # Print results
-    print_file_results(results, show_detailed)
-    print_validation_summary(results)
+    # Fold results as they arrive, then print
+    summary = summarize_results(results, show_detailed)
+    print_file_results(summary)
+    print_validation_summary(summary)
+    
+    if validator.cache is not None:
+        save_validation_cache(validator.cache)
     
     # Final status
-    invalid_count = sum(1 for r in results if not r.is_valid)
-    critical_count = sum(1 for r in results for e in r.errors if "CRITICAL" in e)
+    invalid_count = summary.total_files - summary.valid_files
+    critical_count = summary.critical_count
     
-    print("\n" + "=" * 70)
+    buf = io.StringIO()
+    print("\n" + "=" * 70, file=buf)
     if invalid_count == 0:
         if critical_count == 0:
-            print("🎉 All artifacts are valid and follow anti-checklist methodology!")
-            print(" Ready for build and deployment")
-            return 0
+            print("🎉 All artifacts are valid and follow anti-checklist methodology!", file=buf)
+            print(" Ready for build and deployment", file=buf)
+            exit_code = 0
         else:
-            print(f"  {critical_count} critical methodology issues found")
-            print("🔧 Please address anti-checklist methodology requirements")
-            return 1
+            print(f"  {critical_count} critical methodology issues found", file=buf)
+            print("🔧 Please address anti-checklist methodology requirements", file=buf)
+            exit_code = 1
     else:
-        print(f" {invalid_count} artifacts failed validation")
+        print(f" {invalid_count} artifacts failed validation", file=buf)
         if critical_count > 0:
-            print(f" Including {critical_count} critical methodology issues")
-        print(" Please fix errors before building")
-        return 1
+            print(f" Including {critical_count} critical methodology issues", file=buf)
+        print(" Please fix errors before building", file=buf)
+        exit_code = 1
+        
+    sys.stdout.write(buf.getvalue())
+    return exit_code
 
 if __name__ == "__main__":
     exit(main())